@@ -1,12 +1,17 @@
 from __future__ import annotations
+import bisect
+import os
+import time
+import numpy as np
 import streamlit as st
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
-from uuid import uuid4
+from operator import attrgetter
 
 from calendar_export import tasks_to_ics
 from calendar_import import parse_ics_bytes
-from models import AppState, Subject
+from models import AppState, Subject, Task, new_id
 from pdf_export import week_plan_to_pdf
 from planner import (
     build_risk_list,
@@ -14,14 +19,18 @@ from planner import (
     generate_week_plan,
     reschedule_overdue,
 )
-from storage import ensure_data_dir, migrate_repo_data_once
+from storage import DATA_DIR, ensure_data_dir, migrate_repo_data_once
 from profiles import (
     create_profile,
     delete_profile,
+    flush_saves,
     list_profiles,
     load_profile,
     migrate_legacy_state,
-    save_profile,
+    has_pending_saves,
+    profile_path,
+    schedule_save,
+    ProfileConflictError,
 )
 
 
@@ -30,14 +39,48 @@ DAY_LABELS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
 st.set_page_config(page_title="Study Planner", page_icon="📚", layout="wide")
 
 
+@st.cache_resource
+def _ics_executor() -> ThreadPoolExecutor:
+    # One shared worker outlives reruns (module globals are re-created
+    # each script run, so the pool lives in the resource cache)
+    return ThreadPoolExecutor(max_workers=1)
+
+
+def _profile_mtime(name: str) -> float:
+    try:
+        return os.path.getmtime(profile_path(name))
+    except OSError:
+        return 0.0
+
+
+def _data_dir_mtime() -> int:
+    # Renames into .data (every atomic save) bump the directory mtime
+    try:
+        return os.stat(DATA_DIR).st_mtime_ns
+    except OSError:
+        return 0
+
+
+@st.cache_data(show_spinner=False)
+def _cached_list_profiles(mtime_ns: int) -> list[str]:
+    return list_profiles()
+
+
+@st.cache_data(show_spinner=False)
+def _cached_load(name: str, mtime: float) -> AppState:
+    # mtime keys the cache so edits on disk invalidate the memoized state
+    return load_profile(name)
+
+
 def _ensure_session_state() -> list[str]:
     ensure_data_dir()
     migrate_repo_data_once()
     migrate_legacy_state()
-    profiles = list_profiles()
+    profiles = _cached_list_profiles(_data_dir_mtime())
     if not profiles:
         create_profile("default")
-        profiles = list_profiles()
+        _cached_list_profiles.clear()
+        profiles = _cached_list_profiles(_data_dir_mtime())
 
     if "profile_name" not in st.session_state:
         st.session_state.profile_name = profiles[0]
@@ -46,14 +89,19 @@ def _ensure_session_state() -> list[str]:
         st.session_state.profile_name = profiles[0]
 
     if "state" not in st.session_state:
-        st.session_state.state = load_profile(st.session_state.profile_name)
+        name = st.session_state.profile_name
+        st.session_state.state = _cached_load(name, _profile_mtime(name))
 
     return profiles
 
 
 def _switch_profile(name: str) -> None:
+    # Queued snapshots must land before the mtime is read, or the cached
+    # load can resurrect a pre-save state and wedge later saves on a
+    # version conflict
+    flush_saves()
     st.session_state.profile_name = name
-    st.session_state.state = load_profile(name)
+    st.session_state.state = _cached_load(name, _profile_mtime(name))
 
 
 def _coerce_date(value: object) -> date | None:
@@ -64,6 +112,54 @@ def _coerce_date(value: object) -> date | None:
     return None
 
 
+def _editor_changed(original: pd.DataFrame, edited: pd.DataFrame) -> bool:
+    # One vectorized hash comparison instead of a per-cell Python diff
+    return int(pd.util.hash_pandas_object(original).sum()) != int(
+        pd.util.hash_pandas_object(edited).sum()
+    )
+
+
+def _event_fingerprint(ev) -> tuple:
+    # Integer timestamps hash cheaper than datetime objects
+    return (ev.title, int(ev.start.timestamp()), int(ev.end.timestamp()))
+
+
+@st.cache_data(show_spinner=False)
+def _event_key_set(version: int, _events: list) -> set[tuple]:
+    # Keyed on the state's monotonic events version: every event
+    # mutation bumps it, and values are process-unique so stale entries
+    # can never be served to another list
+    return {_event_fingerprint(e) for e in _events}
+
+
+@st.cache_data(show_spinner=False)
+def _cached_risk(subject_fp: tuple, task_fp: tuple, today: date, _subjects, _tasks):
+    return build_risk_list(_subjects, _tasks, today)
+
+
+@st.cache_data(show_spinner=False)
+def _cached_busy_by_day(
+    events_version: int, start: date, num_days: int, _events: list
+) -> dict[date, int]:
+    # Same monotonic version key as _event_key_set: reruns that only
+    # touch tasks reuse the busy window instead of rescanning events
+    return compute_busy_minutes_by_day(_events, start, num_days)
+
+
+@st.cache_data(show_spinner=False)
+def _editor_df(fingerprint: tuple, _rows: list[dict]) -> pd.DataFrame:
+    # fingerprint carries everything that can change in _rows, so the
+    # frame build is skipped on reruns that did not touch the data
+    return pd.DataFrame(_rows).set_index("id")
+
+
+def _save_state(state: AppState) -> None:
+    try:
+        schedule_save(current_profile, state)
+    except ProfileConflictError as e:
+        st.error(str(e))
+
+
 def _queue_toast(message: str) -> None:
     st.session_state.toast_message = message
 
@@ -127,7 +223,7 @@ def render_setup(state: AppState) -> None:
             else:
                 state.subjects.append(
                     Subject(
-                        id=str(uuid4()),
+                        id=new_id(),
                         name=name.strip(),
                         deadline=deadline,
                         difficulty=int(difficulty),
@@ -135,7 +231,7 @@ def render_setup(state: AppState) -> None:
                         notes=notes.strip(),
                     )
                 )
-                save_profile(current_profile, state)
+                _save_state(state)
                 st.toast("Subject added.")
 
     st.divider()
@@ -156,7 +252,11 @@ def render_setup(state: AppState) -> None:
         }
         for s in state.subjects
     ]
-    df = pd.DataFrame(rows).set_index("id")
+    fingerprint = tuple(
+        (s.id, s.name, s.deadline, s.difficulty, s.est_hours, s.notes)
+        for s in state.subjects
+    )
+    df = _editor_df(fingerprint, rows)
     edited = st.data_editor(
         df,
         hide_index=True,
@@ -176,28 +276,35 @@ def render_setup(state: AppState) -> None:
         key=f"subjects_editor_{current_profile}",
     )
 
-    edited_records = edited.reset_index().to_dict("records")
-    selected_ids = [row["id"] for row in edited_records if row.get("Select")]
-    selected_names = [row["Name"] for row in edited_records if row.get("Select")]
+    if _editor_changed(df, edited):
+        edited_rows = list(
+            edited.reset_index()[
+                ["id", "Select", "Name", "Deadline", "Difficulty", "Est hours", "Notes"]
+            ].itertuples(index=False, name=None)
+        )
+    else:
+        edited_rows = []
+    selected_ids = [row[0] for row in edited_rows if row[1]]
+    selected_names = [row[2] for row in edited_rows if row[1]]
 
     col_apply, col_delete = st.columns([1, 1])
 
     if col_apply.button("Apply changes"):
+        if not edited_rows:
+            st.info("No changes to apply.")
+            return
         id_to_subject = {s.id: s for s in state.subjects}
         name_updates = {}
         updated_subjects = []
-        for row in edited_records:
-            subject = id_to_subject.get(row["id"])
+        for sid, _sel, name_value, deadline_value, difficulty_value, est_value, notes_value in edited_rows:
+            subject = id_to_subject.get(sid)
             if not subject:
                 continue
-            new_name = str(row.get("Name") or "").strip()
+            new_name = str(name_value or "").strip()
             if not new_name:
                 st.warning("Subject name cannot be empty.")
                 return
-            deadline = _coerce_date(row.get("Deadline")) or subject.deadline
-            difficulty_value = row.get("Difficulty")
-            est_value = row.get("Est hours")
-            notes_value = row.get("Notes")
+            deadline = _coerce_date(deadline_value) or subject.deadline
             difficulty = (
                 subject.difficulty
                 if difficulty_value is None or pd.isna(difficulty_value)
@@ -221,12 +328,14 @@ def render_setup(state: AppState) -> None:
             updated_subjects.append(subject)
 
         if name_updates:
-            for task in state.tasks:
-                if task.subject_id in name_updates:
-                    task.subject_name = name_updates[task.subject_id]
+            by_subject = state.tasks_by_subject()
+            for sid_changed, new_name in name_updates.items():
+                for i in by_subject.get(sid_changed, ()):
+                    state.tasks[i].subject_name = new_name
+            state.invalidate_task_columns()
 
         state.subjects = updated_subjects
-        save_profile(current_profile, state)
+        _save_state(state)
         _queue_toast("Subjects updated.")
         st.rerun()
 
@@ -240,9 +349,16 @@ def render_setup(state: AppState) -> None:
                 st.write("This will remove the subjects and their tasks.")
                 st.write(", ".join(selected_names))
                 if st.button("Delete", type="primary"):
-                    state.subjects = [s for s in state.subjects if s.id not in selected_ids]
-                    state.tasks = [t for t in state.tasks if t.subject_id not in selected_ids]
-                    save_profile(current_profile, state)
+                    doomed = set(selected_ids)
+                    state.subjects[:] = [s for s in state.subjects if s.id not in doomed]
+                    # The subject index says whether any tasks are affected
+                    # at all, so deleting task-less subjects skips the
+                    # full task rewrite
+                    by_subject = state.tasks_by_subject()
+                    if any(by_subject.get(sid) for sid in doomed):
+                        state.tasks[:] = [t for t in state.tasks if t.subject_id not in doomed]
+                        state.invalidate_task_columns()
+                    _save_state(state)
                     _queue_toast("Subjects deleted.")
                     st.rerun()
 
@@ -256,13 +372,42 @@ def render_calendar(state: AppState) -> None:
     uploaded = st.file_uploader("Upload .ics file", type=["ics"], key="ics_upload")
     parsed_events = []
     if uploaded:
-        try:
-            parsed_events = parse_ics_bytes(uploaded.read())
-        except Exception as e:
-            st.error(f"Could not read ICS file: {e}")
+        # Parsing happens on a worker thread; the rerun loop polls the
+        # future so large uploads don't freeze the page
+        # file_id is unique per upload, so a different file with the
+        # same name and byte size still re-parses
+        upload_sig = uploaded.file_id
+        if st.session_state.get("ics_upload_sig") != upload_sig:
+            st.session_state.ics_upload_sig = upload_sig
+            st.session_state.pop("ics_parsed", None)
+            st.session_state.pop("ics_parse_error", None)
+            st.session_state.ics_future = _ics_executor().submit(
+                parse_ics_bytes, uploaded.read()
+            )
+
+        future = st.session_state.get("ics_future")
+        if future is not None:
+            if future.done():
+                st.session_state.ics_future = None
+                try:
+                    st.session_state.ics_parsed = future.result()
+                except Exception as e:
+                    st.session_state.ics_parse_error = str(e)
+            else:
+                with st.spinner("Parsing calendar..."):
+                    time.sleep(0.1)
+                st.rerun()
+
+        parse_error = st.session_state.get("ics_parse_error")
+        if parse_error:
+            st.error(f"Could not read ICS file: {parse_error}")
         else:
+            parsed_events = st.session_state.get("ics_parsed", [])
             if not parsed_events:
                 st.warning("No events found in this file.")
+    else:
+        for stale_key in ("ics_upload_sig", "ics_parsed", "ics_parse_error", "ics_future"):
+            st.session_state.pop(stale_key, None)
 
     if parsed_events:
         preview = [
@@ -282,13 +427,18 @@ def render_calendar(state: AppState) -> None:
             if import_mode == "Replace":
                 state.events = parsed_events
             else:
-                existing_keys = {(e.title, e.start, e.end): e for e in state.events}
-                for ev in parsed_events:
-                    key = (ev.title, ev.start, ev.end)
-                    if key not in existing_keys:
-                        existing_keys[key] = ev
-                state.events = list(existing_keys.values())
-            save_profile(current_profile, state)
+                existing_keys = _event_key_set(
+                    state.events_version(), state.events
+                )
+                new_only = [
+                    ev for ev in parsed_events
+                    if _event_fingerprint(ev) not in existing_keys
+                ]
+                for ev in new_only:
+                    # events stay sorted by start, so renders skip the sort
+                    bisect.insort(state.events, ev, key=attrgetter("start"))
+            state.bump_events_version()
+            _save_state(state)
             st.toast("Events imported.")
 
     st.divider()
@@ -297,7 +447,7 @@ def render_calendar(state: AppState) -> None:
         st.info("No calendar events stored yet.")
         return
 
-    sorted_events = sorted(state.events, key=lambda x: x.start)
+    sorted_events = state.events  # kept sorted by start on load/insert
     event_rows = [
         {
             "Select": False,
@@ -311,7 +461,8 @@ def render_calendar(state: AppState) -> None:
     ]
 
     with st.form("convert_events_form"):
-        events_df = pd.DataFrame(event_rows).set_index("id")
+        fingerprint = tuple((ev.id, ev.title, ev.start, ev.end) for ev in sorted_events)
+        events_df = _editor_df(fingerprint, event_rows)
         selected_table = st.data_editor(
             events_df,
             hide_index=True,
@@ -340,8 +491,13 @@ def render_calendar(state: AppState) -> None:
         convert = st.form_submit_button("Convert selected to subjects")
 
     if convert:
-        selected_records = selected_table.reset_index().to_dict("records")
-        selected_ids = {row["id"] for row in selected_records if row.get("Select")}
+        selected_ids = {
+            eid
+            for eid, sel in selected_table.reset_index()[["id", "Select"]].itertuples(
+                index=False, name=None
+            )
+            if sel
+        }
         if not selected_ids:
             st.warning("Select at least one event to convert.")
         else:
@@ -350,7 +506,7 @@ def render_calendar(state: AppState) -> None:
                     continue
                 state.subjects.append(
                     Subject(
-                        id=str(uuid4()),
+                        id=new_id(),
                         name=ev.title,
                         deadline=ev.start.date(),
                         difficulty=int(default_difficulty),
@@ -360,7 +516,8 @@ def render_calendar(state: AppState) -> None:
                 )
             if remove_converted:
                 state.events = [ev for ev in sorted_events if ev.id not in selected_ids]
-            save_profile(current_profile, state)
+                state.bump_events_version()
+            _save_state(state)
             _queue_toast("Events converted to subjects.")
             st.rerun()
 
@@ -371,13 +528,230 @@ def render_calendar(state: AppState) -> None:
             st.write("This will remove all imported events.")
             if st.button("Clear events", type="primary"):
                 state.events = []
-                save_profile(current_profile, state)
+                state.bump_events_version()
+                _save_state(state)
                 _queue_toast("Events cleared.")
                 st.rerun()
 
         _confirm_clear_events()
 
 
+def _export_fingerprint(state: AppState, tasks: list[Task], week_start: date) -> tuple:
+    s = state.settings
+    return (
+        week_start,
+        tuple(
+            (t.id, t.subject_name, t.day, t.minutes, t.done, t.notes)
+            for t in tasks
+        ),
+        (
+            s.minutes_per_day,
+            tuple(s.rest_days),
+            s.chunk_minutes,
+            s.daily_buffer_minutes,
+            s.preferred_start_hour,
+            s.preferred_end_hour,
+        ),
+        tuple((e.start, e.end) for e in state.events),
+    )
+
+
+@st.cache_data(show_spinner=False)
+def _cached_ics(fingerprint: tuple, _tasks, week_start, _settings, _events):
+    return tasks_to_ics(_tasks, week_start, _settings, _events)
+
+
+@st.cache_data(show_spinner=False)
+def _cached_pdf(fingerprint: tuple, _tasks, _settings, week_start, _risk_items):
+    return week_plan_to_pdf(_tasks, _settings, week_start, _risk_items)
+
+
+@st.cache_data(show_spinner=False)
+def _week_table_df(fingerprint: tuple, _tasks: list[Task]) -> pd.DataFrame:
+    # Column-wise build with declared dtypes: no per-row dict allocation
+    # and no dtype inference. The sort only reruns when the fingerprint
+    # says tasks changed.
+    ordered = sorted(_tasks, key=lambda x: (x.day, x.subject_name.lower()))
+    n = len(ordered)
+    return pd.DataFrame(
+        {
+            "Date": pd.to_datetime([t.day for t in ordered]),
+            "Day": [DAY_LABELS[t.day.weekday()] for t in ordered],
+            "Subject": [t.subject_name for t in ordered],
+            "Minutes": np.fromiter((t.minutes for t in ordered), dtype=np.int32, count=n),
+            "Done": np.fromiter((t.done for t in ordered), dtype=bool, count=n),
+            "Notes": [t.notes for t in ordered],
+        },
+        index=pd.Index([t.id for t in ordered], name="id"),
+    )
+
+
+def _render_week_metrics(
+    state: AppState,
+    week_start: date,
+    chosen_subject: str,
+    show_done: bool,
+) -> None:
+    week_end = week_start + timedelta(days=6)
+    cols = state.task_columns()
+    in_week = (cols["day"] >= np.datetime64(week_start)) & (
+        cols["day"] <= np.datetime64(week_end)
+    )
+    mask = in_week
+    if chosen_subject != "All subjects":
+        mask = mask & (cols["subject_name"] == chosen_subject)
+    if not show_done:
+        mask = mask & ~cols["done"]
+    sel_minutes = cols["minutes"][mask]
+    sel_done = cols["done"][mask]
+    week_total = int(sel_minutes.sum())
+    week_done = int(sel_minutes[sel_done].sum())
+    week_remaining = week_total - week_done
+    m1, m2, m3 = st.columns(3)
+    m1.metric("Week planned (m)", week_total)
+    m2.metric("Done (m)", week_done)
+    m3.metric("Remaining (m)", week_remaining)
+
+    busy_by_day = _cached_busy_by_day(
+        state.events_version(), week_start, 7, state.events
+    )
+    # Bucket the masked tasks by day offset in C instead of a Python sweep
+    offsets = (cols["day"][mask] - np.datetime64(week_start)).astype(np.int64)
+    planned_per_day = np.bincount(offsets, weights=sel_minutes, minlength=7)
+    done_per_day = np.bincount(
+        offsets[sel_done], weights=sel_minutes[sel_done], minlength=7
+    )
+    day_totals = []
+    for i in range(7):
+        d = week_start + timedelta(days=i)
+        planned = int(planned_per_day[i])
+        done = int(done_per_day[i])
+        busy = busy_by_day.get(d, 0)
+        capacity = max(
+            0,
+            state.settings.minutes_per_day
+            - busy
+            - state.settings.daily_buffer_minutes,
+        )
+        day_totals.append(
+            {
+                "Date": f"{DAY_LABELS[d.weekday()]} {d.month:02d}/{d.day:02d}",
+                "Planned (m)": planned,
+                "Done (m)": done,
+                "Remaining (m)": planned - done,
+                "Busy (m)": busy,
+                "Capacity after busy (m)": capacity,
+            }
+        )
+
+    with st.expander("Per-day totals", expanded=False):
+        st.table(day_totals)
+
+
+@st.fragment
+def _render_week_table(
+    state: AppState,
+    filtered_tasks: list[Task],
+    week_start: date,
+    chosen_subject: str,
+    show_done: bool,
+) -> None:
+    """
+    Week table plus its metrics, isolated as a fragment: Done toggles and
+    saves rerun only this block instead of the whole script, so the
+    sidebar, profile load, and the other tabs stay untouched per click.
+    """
+    if not filtered_tasks:
+        st.info("No tasks to show for this week.")
+        return
+
+    if len(filtered_tasks) <= 20:
+        # Small-week fast path: a handful of rows doesn't justify a
+        # DataFrame + data_editor round trip
+        pending = []
+        small_sorted = sorted(
+            filtered_tasks, key=lambda x: (x.day, x.subject_name.lower())
+        )
+        for t in small_sorted:
+            c_done, c_date, c_subject, c_minutes, c_notes = st.columns(
+                [1, 2, 3, 1, 4]
+            )
+            checked = c_done.checkbox(
+                f"done_{t.id}",
+                value=t.done,
+                key=f"week_small_done_{t.id}",
+                label_visibility="collapsed",
+            )
+            c_date.write(f"{DAY_LABELS[t.day.weekday()]} {t.day.isoformat()}")
+            c_subject.write(t.subject_name)
+            c_minutes.write(f"{t.minutes}m")
+            c_notes.caption(t.notes or "")
+            if checked != t.done:
+                pending.append((t, checked, t.notes or ""))
+
+        if pending and st.button("Save changes"):
+            for task, new_done, new_notes in pending:
+                task.done = new_done
+                task.notes = new_notes
+            state.invalidate_task_columns()
+            _save_state(state)
+            st.toast("Changes saved.")
+        _render_week_metrics(state, week_start, chosen_subject, show_done)
+        return
+
+    fingerprint = tuple(
+        (t.id, t.day, t.subject_name, t.minutes, t.done, t.notes)
+        for t in filtered_tasks
+    )
+    df = _week_table_df(fingerprint, filtered_tasks)
+    edited = st.data_editor(
+        df,
+        hide_index=True,
+        use_container_width=True,
+        column_config={
+            "Date": st.column_config.DateColumn("Date"),
+            "Day": st.column_config.TextColumn("Day"),
+            "Subject": st.column_config.TextColumn("Subject"),
+            "Minutes": st.column_config.NumberColumn("Minutes", format="%d"),
+            "Done": st.column_config.CheckboxColumn("Done"),
+            "Notes": st.column_config.TextColumn("Notes", width="medium"),
+        },
+        disabled=["Date", "Day", "Subject", "Minutes"],
+        key=f"week_table_editor_{current_profile}_{week_start.isoformat()}",
+    )
+
+    pending = []
+    if _editor_changed(df, edited):
+        # Only Done/Notes are editable; a vectorized inequality narrows
+        # the walk to the rows that actually changed
+        changed_mask = (df["Done"] != edited["Done"]) | (
+            df["Notes"].fillna("") != edited["Notes"].fillna("")
+        )
+        task_by_id = {t.id: t for t in filtered_tasks}
+        for tid, done_value, notes_value in (
+            edited.loc[changed_mask, ["Done", "Notes"]]
+            .reset_index()
+            .itertuples(index=False, name=None)
+        ):
+            task = task_by_id.get(tid)
+            if task is None:
+                continue
+            new_done = bool(done_value)
+            new_notes = notes_value or ""
+            if task.done != new_done or (task.notes or "") != new_notes:
+                pending.append((task, new_done, new_notes))
+
+    if pending and st.button("Save changes"):
+        for task, new_done, new_notes in pending:
+            task.done = new_done
+            task.notes = new_notes
+        state.invalidate_task_columns()
+        _save_state(state)
+        st.toast("Changes saved.")
+
+    _render_week_metrics(state, week_start, chosen_subject, show_done)
+
+
 def render_plan(state: AppState) -> None:
     st.header("Plan")
 
@@ -385,11 +759,12 @@ def render_plan(state: AppState) -> None:
     default_week_start = state.last_generated_on or today
 
     week_start = default_week_start
+    tasks_by_day = state.tasks_by_day()
     col_left, col_right = st.columns([1, 2])
 
     with col_left:
         st.subheader("Today")
-        today_tasks = [t for t in state.tasks if t.day == today]
+        today_tasks = tasks_by_day.get(today, [])
         total_minutes_today = sum(t.minutes for t in today_tasks)
         st.metric("Total minutes today", total_minutes_today)
 
@@ -412,14 +787,23 @@ def render_plan(state: AppState) -> None:
                 for task in today_tasks:
                     if task.id in updates:
                         task.done = bool(updates[task.id])
-                save_profile(current_profile, state)
+                state.invalidate_task_columns()
+                _save_state(state)
                 st.toast("Today updated.")
 
         if st.button("Reschedule overdue"):
             state.tasks = reschedule_overdue(
-                state.tasks, state.settings, today, state.events
+                state.tasks,
+                state.settings,
+                today,
+                state.events,
+                busy_by_day=_cached_busy_by_day(
+                    state.events_version(), today, 180, state.events
+                ),
             )
-            save_profile(current_profile, state)
+            state.invalidate_task_columns()
+            tasks_by_day = state.tasks_by_day()
+            _save_state(state)
             st.toast("Overdue tasks moved forward.")
 
     with col_right:
@@ -430,10 +814,22 @@ def render_plan(state: AppState) -> None:
         with action_col:
             if st.button("Generate / Refresh plan", type="primary"):
                 state.tasks = generate_week_plan(
-                    state.subjects, state.settings, week_start, state.tasks, state.events
+                    state.subjects,
+                    state.settings,
+                    week_start,
+                    state.tasks,
+                    state.events,
+                    busy_by_day=_cached_busy_by_day(
+                        state.events_version(),
+                        week_start,
+                        7,
+                        state.events,
+                    ),
                 )
                 state.last_generated_on = week_start
-                save_profile(current_profile, state)
+                state.invalidate_task_columns()
+                tasks_by_day = state.tasks_by_day()
+                _save_state(state)
                 st.toast("Plan generated.")
         week_end = week_start + timedelta(days=6)
         st.caption(f"Week: {week_start.isoformat()} - {week_end.isoformat()}")
@@ -445,102 +841,23 @@ def render_plan(state: AppState) -> None:
         with done_col:
             show_done = st.checkbox("Show done", value=True)
 
-        week_tasks = [t for t in state.tasks if week_start <= t.day <= week_end]
+        week_days = [week_start + timedelta(days=i) for i in range(7)]
+        week_tasks = [t for d in week_days for t in tasks_by_day.get(d, [])]
         filtered_tasks = [
             t for t in week_tasks
             if (chosen_subject == "All subjects" or t.subject_name == chosen_subject)
             and (show_done or not t.done)
         ]
 
-        if not filtered_tasks:
-            st.info("No tasks to show for this week.")
-        else:
-            table_rows = [
-                {
-                    "id": t.id,
-                    "Date": t.day,
-                    "Day": t.day.strftime("%a"),
-                    "Subject": t.subject_name,
-                    "Minutes": t.minutes,
-                    "Done": t.done,
-                    "Notes": t.notes,
-                }
-                for t in sorted(filtered_tasks, key=lambda x: (x.day, x.subject_name.lower()))
-            ]
-            df = pd.DataFrame(table_rows).set_index("id")
-            edited = st.data_editor(
-                df,
-                hide_index=True,
-                use_container_width=True,
-                column_config={
-                    "Date": st.column_config.DateColumn("Date"),
-                    "Day": st.column_config.TextColumn("Day"),
-                    "Subject": st.column_config.TextColumn("Subject"),
-                    "Minutes": st.column_config.NumberColumn("Minutes", format="%d"),
-                    "Done": st.column_config.CheckboxColumn("Done"),
-                    "Notes": st.column_config.TextColumn("Notes", width="medium"),
-                },
-                disabled=["Date", "Day", "Subject", "Minutes"],
-                key=f"week_table_editor_{current_profile}_{week_start.isoformat()}",
-            )
-
-            edited_records = edited.reset_index().to_dict("records")
-            updates = {row["id"]: row for row in edited_records}
-            pending = []
-            for task in filtered_tasks:
-                row = updates.get(task.id)
-                if not row:
-                    continue
-                new_done = bool(row.get("Done"))
-                new_notes = row.get("Notes") or ""
-                if task.done != new_done or (task.notes or "") != new_notes:
-                    pending.append((task, new_done, new_notes))
-
-            if pending and st.button("Save changes"):
-                for task, new_done, new_notes in pending:
-                    task.done = new_done
-                    task.notes = new_notes
-                save_profile(current_profile, state)
-                st.toast("Changes saved.")
-
-            week_total = sum(t.minutes for t in filtered_tasks)
-            week_done = sum(t.minutes for t in filtered_tasks if t.done)
-            week_remaining = week_total - week_done
-            m1, m2, m3 = st.columns(3)
-            m1.metric("Week planned (m)", week_total)
-            m2.metric("Done (m)", week_done)
-            m3.metric("Remaining (m)", week_remaining)
-
-            busy_by_day = compute_busy_minutes_by_day(state.events, week_start, num_days=7)
-            day_totals = []
-            for i in range(7):
-                d = week_start + timedelta(days=i)
-                day_tasks = [t for t in filtered_tasks if t.day == d]
-                planned = sum(t.minutes for t in day_tasks)
-                done = sum(t.minutes for t in day_tasks if t.done)
-                busy = busy_by_day.get(d, 0)
-                capacity = max(
-                    0,
-                    state.settings.minutes_per_day
-                    - busy
-                    - state.settings.daily_buffer_minutes,
-                )
-                day_totals.append(
-                    {
-                        "Date": d.strftime("%a %m/%d"),
-                        "Planned (m)": planned,
-                        "Done (m)": done,
-                        "Remaining (m)": planned - done,
-                        "Busy (m)": busy,
-                        "Capacity after busy (m)": capacity,
-                    }
-                )
-
-            with st.expander("Per-day totals", expanded=False):
-                st.table(day_totals)
+        _render_week_table(state, filtered_tasks, week_start, chosen_subject, show_done)
 
     st.divider()
-    risk_items = build_risk_list(state.subjects, state.tasks, today)
+    subject_fp = tuple(
+        (s.id, s.name, s.deadline, s.difficulty, s.est_hours)
+        for s in state.subjects
+    )
+    task_fp = tuple((t.id, t.subject_id, t.minutes, t.done) for t in state.tasks)
+    risk_items = _cached_risk(subject_fp, task_fp, today, state.subjects, state.tasks)
     with st.expander("Risk list", expanded=False):
         if not risk_items:
             st.info("No risky subjects right now.")
@@ -564,26 +881,38 @@ def render_plan(state: AppState) -> None:
 
     st.divider()
     st.subheader("Exports")
-    week_tasks = [t for t in state.tasks if week_start <= t.day <= week_end]
     if week_tasks:
-        ics_bytes, ics_warnings = tasks_to_ics(
-            week_tasks, week_start, state.settings, state.events
-        )
+        # Generation is deferred to the click; reruns that never download
+        # skip the ICS/PDF builds entirely, and repeat clicks on unchanged
+        # data come straight from the memo
+        export_fp = _export_fingerprint(state, week_tasks, week_start)
+
+        def _build_ics() -> bytes:
+            ics_bytes, ics_warnings = _cached_ics(
+                export_fp, week_tasks, week_start, state.settings, state.events
+            )
+            st.session_state.ics_warnings = ics_warnings
+            return ics_bytes
+
+        def _build_pdf() -> bytes:
+            risk_fp = tuple((r["subject"], r["score"], r["level"]) for r in risk_items)
+            return _cached_pdf(
+                (export_fp, risk_fp), week_tasks, state.settings, week_start, risk_items
+            )
+
         st.download_button(
             "Download ICS",
-            data=ics_bytes,
+            data=_build_ics,
             file_name=f"study_plan_{week_start.isoformat()}.ics",
             mime="text/calendar",
         )
+        ics_warnings = st.session_state.pop("ics_warnings", None)
         if ics_warnings:
             st.warning(" | ".join(ics_warnings))
 
-        pdf_bytes = week_plan_to_pdf(
-            week_tasks, state.settings, week_start, risk_items
-        )
         st.download_button(
             "Download PDF",
-            data=pdf_bytes,
+            data=_build_pdf,
             file_name=f"study_plan_{week_start.isoformat()}.pdf",
             mime="application/pdf",
         )
@@ -594,8 +923,22 @@ def render_plan(state: AppState) -> None:
 def render_progress(state: AppState) -> None:
     st.header("Progress")
 
-    total_minutes = sum(t.minutes for t in state.tasks)
-    done_minutes = sum(t.minutes for t in state.tasks if t.done)
+    # One frame + one grouped pass replaces the per-subject rescans of tasks
+    tasks_df = pd.DataFrame(
+        [
+            {
+                "subject_id": t.subject_id,
+                "total": t.minutes,
+                "done": t.minutes if t.done else 0,
+            }
+            for t in state.tasks
+        ],
+        columns=["subject_id", "total", "done"],
+    )
+    agg = tasks_df.groupby("subject_id", sort=False)[["total", "done"]].sum()
+
+    total_minutes = int(tasks_df["total"].sum())
+    done_minutes = int(tasks_df["done"].sum())
     remaining_minutes = total_minutes - done_minutes
 
     a, b, c = st.columns(3)
@@ -609,11 +952,13 @@ def render_progress(state: AppState) -> None:
         st.info("No subjects yet.")
         return
 
+    per_subject = agg.reindex([s.id for s in state.subjects], fill_value=0)
     subject_rows = []
-    for subj in state.subjects:
-        subj_tasks = [t for t in state.tasks if t.subject_id == subj.id]
-        total = sum(t.minutes for t in subj_tasks)
-        done = sum(t.minutes for t in subj_tasks if t.done)
+    for subj, total, done in zip(
+        state.subjects, per_subject["total"], per_subject["done"]
+    ):
+        total = int(total)
+        done = int(done)
         remaining = total - done
         completion_rate = (done / total) if total else 0
         subject_rows.append(
@@ -676,7 +1021,7 @@ def render_settings(state: AppState) -> None:
         state.settings.preferred_end_hour = end_hour
 
     if st.button("Save settings", type="primary"):
-        save_profile(current_profile, state)
+        _save_state(state)
         st.toast("Settings saved.")
 
     if st.button("Reset current profile (keep settings)"):
@@ -688,7 +1033,8 @@ def render_settings(state: AppState) -> None:
                 state.subjects = []
                 state.tasks = []
                 state.events = []
-                save_profile(current_profile, state)
+                state.bump_events_version()
+                _save_state(state)
                 _queue_toast("Profile reset.")
                 st.rerun()
 
@@ -710,7 +1056,7 @@ if not state.subjects:
 
 with st.sidebar:
     st.header("Profile")
-    profiles = list_profiles()
+    profiles = _cached_list_profiles(_data_dir_mtime())
     selected_profile = st.selectbox(
         "Active profile",
         options=profiles,
@@ -728,6 +1074,7 @@ with st.sidebar:
             except ValueError as e:
                 st.error(str(e))
             else:
+                _cached_list_profiles.clear()
                 _queue_toast(f"Profile '{new_profile_name.strip()}' created.")
                 st.session_state.profile_name = new_profile_name.strip()
                 st.session_state.state = new_state
@@ -743,6 +1090,8 @@ with st.sidebar:
                 st.write(f"Delete profile '{current_profile}' and its data?")
                 if st.button("Delete", type="primary"):
                     delete_profile(current_profile)
+                    _cached_list_profiles.clear()
+                    _cached_load.clear()
                     remaining = list_profiles()
                     _switch_profile(remaining[0])
                     _queue_toast("Profile deleted.")
@@ -755,6 +1104,8 @@ with st.sidebar:
     pages = ["Setup", "Calendar", "Plan", "Progress", "Settings"]
     page = st.radio("", pages, key="nav_page")
 
+    if has_pending_saves():
+        st.caption("Saving changes…")
     st.caption("Workflow: Setup -> Calendar -> Plan -> Progress")
     st.caption("Data is stored locally in the .data folder inside this project.")
 
@@ -1,5 +1,8 @@
 from __future__ import annotations
+import copy
+import numpy as np
 from datetime import date, datetime, time, timedelta
+from functools import lru_cache
 from typing import List, Tuple
 from zoneinfo import ZoneInfo
 from uuid import uuid4
@@ -8,7 +11,10 @@ from models import Task, Settings, Event
 from planner import compute_busy_minutes_by_day
 
 
+@lru_cache(maxsize=1)
 def _get_timezone() -> ZoneInfo:
+    # The local zone does not change mid-session; resolve it once instead
+    # of re-running the astimezone/ZoneInfo dance on every export.
     try:
         local = datetime.now().astimezone().tzinfo
         if isinstance(local, ZoneInfo):
@@ -22,16 +28,25 @@ def _get_timezone() -> ZoneInfo:
         return ZoneInfo("Asia/Bangkok")
 
 
+@lru_cache(maxsize=1)
+def _calendar_template() -> Calendar:
+    # The three header properties never change; parse them once and hand
+    # each export a shallow copy instead of re-adding them per call
+    cal = Calendar()
+    cal.add("PRODID", "-//Study Planner//Local//")
+    cal.add("version", "2.0")
+    cal.add("X-WR-CALNAME", "Study Plan")
+    return cal
+
+
 def tasks_to_ics(
     tasks: List[Task],
     week_start: date,
     settings: Settings,
     events: List[Event] | None = None,
 ) -> Tuple[bytes, List[str]]:
-    cal = Calendar()
-    cal.add("PRODID", "-//Study Planner//Local//")
-    cal.add("version", "2.0")
-    cal.add("X-WR-CALNAME", "Study Plan")
+    cal = copy.copy(_calendar_template())
+    cal.subcomponents = []
 
     warnings: List[str] = []
     tz = _get_timezone()
@@ -50,44 +65,47 @@ def tasks_to_ics(
     events = events or []
     busy_by_day = compute_busy_minutes_by_day(events, start_day, num_days=window_days)
 
+    # Per-day capacity in one vectorized pass: subtract busy and buffer,
+    # clip at zero, zero out rest days
+    day_offsets = np.arange(window_days)
+    busy_arr = np.fromiter(
+        (busy_by_day.get(start_day + timedelta(days=int(i)), 0) for i in day_offsets),
+        dtype=np.int32,
+        count=window_days,
+    )
+    weekdays = (day_offsets + start_day.weekday()) % 7
+    capacity = np.clip(
+        settings.minutes_per_day - busy_arr - settings.daily_buffer_minutes, 0, None
+    )
+    if settings.rest_days:
+        capacity[np.isin(weekdays, settings.rest_days)] = 0
+
+    # Build the aware anchors once; adding a timedelta per day skips the
+    # tz normalization datetime.combine would redo for every window day
+    window_start_0 = datetime.combine(
+        start_day, time(hour=start_hour, minute=0), tzinfo=tz
+    )
+    window_end_0 = datetime.combine(start_day, time(hour=end_hour, minute=0), tzinfo=tz)
+
     day_info: dict[date, dict] = {}
-    window_minutes = max(0, (end_hour - start_hour) * 60)
     for i in range(window_days):
         d = start_day + timedelta(days=i)
-        window_start = datetime.combine(d, time(hour=start_hour, minute=0), tzinfo=tz)
-        window_end = datetime.combine(d, time(hour=end_hour, minute=0), tzinfo=tz)
+        offset = timedelta(days=i)
+        window_start = window_start_0 + offset
+        window_end = window_end_0 + offset
         if window_end <= window_start:
             window_end = window_start + timedelta(hours=1)
 
-        busy = busy_by_day.get(d, 0)
-        if d.weekday() in settings.rest_days:
-            effective_capacity = 0
-        else:
-            effective_capacity = max(0, settings.minutes_per_day - busy - settings.daily_buffer_minutes)
-        available_today = min(window_minutes, effective_capacity)
+        window_minutes = int((window_end - window_start).total_seconds() // 60)
         day_info[d] = {
             "start": window_start,
             "cursor": window_start,
             "end": window_end,
-            "available": available_today,
+            "available": min(window_minutes, int(capacity[i])),
         }
 
-    # Adjust availability with busy minutes from events
-    for i in range(window_days):
-        d = start_day + timedelta(days=i)
-        busy = busy_by_day.get(d, 0)
-        if d.weekday() in settings.rest_days:
-            cap = 0
-        else:
-            cap = max(0, settings.minutes_per_day - busy - settings.daily_buffer_minutes)
-        window_start = day_info[d]["start"]
-        window_end = day_info[d]["end"]
-        window_minutes_local = int((window_end - window_start).total_seconds() // 60)
-        day_info[d]["available"] = min(window_minutes_local, cap)
-        if day_info[d]["cursor"] < window_start:
-            day_info[d]["cursor"] = window_start
-
     pending_unscheduled = 0
+    scheduled_events: List[IcsEvent] = []
     for task in sorted(tasks, key=lambda x: (x.day, x.subject_name.lower())):
         minutes_left = task.minutes
         day_pointer = task.day
@@ -115,7 +133,7 @@ def tasks_to_ics(
             if day_pointer != task.day:
                 planned_desc += f" (moved from {task.day.isoformat()})"
             event.add("description", planned_desc + ".")
-            cal.add_component(event)
+            scheduled_events.append(event)
 
             info["cursor"] = end_time
             info["available"] -= actual_minutes
@@ -137,6 +155,8 @@ def tasks_to_ics(
         overflow_event.add("dtstart", datetime.combine(end_day, time.min, tzinfo=tz))
         overflow_event.add("dtend", datetime.combine(end_day + timedelta(days=1), time.min, tzinfo=tz))
         overflow_event.add("description", "No capacity remained in this window; please reschedule.")
-        cal.add_component(overflow_event)
+        scheduled_events.append(overflow_event)
 
+    # One list splice instead of an add_component call per event
+    cal.subcomponents.extend(scheduled_events)
     return cal.to_ical(), warnings
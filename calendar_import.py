@@ -1,9 +1,9 @@
 from __future__ import annotations
 from datetime import datetime, date
-from typing import List
-from uuid import uuid4
-from icalendar import Calendar
-from models import Event
+from operator import attrgetter
+from typing import Iterator, List
+from icalendar import Event as IcsComponent
+from models import Event, new_id
 
 
 def _normalize_to_datetime(value) -> datetime | None:
@@ -19,12 +19,34 @@ def _normalize_to_datetime(value) -> datetime | None:
     return None
 
 
+def _iter_vevent_blocks(text: str) -> Iterator[str]:
+    """
+    Yield raw VEVENT blocks one at a time, so only a single event is ever
+    parsed into a component tree instead of the whole calendar at once.
+    Folded continuation lines are passed through untouched; the component
+    parser unfolds them.
+    """
+    buf: List[str] | None = None
+    for line in text.splitlines(keepends=True):
+        stripped = line.strip()
+        if stripped == "BEGIN:VEVENT":
+            buf = [line]
+        elif buf is not None:
+            buf.append(line)
+            if stripped == "END:VEVENT":
+                yield "".join(buf)
+                buf = None
+
+
 def parse_ics_bytes(data: bytes) -> List[Event]:
-    cal = Calendar.from_ical(data)
+    text = data.decode("utf-8", errors="replace")
     out: List[Event] = []
 
-    for component in cal.walk():
-        if component.name != "VEVENT":
+    for block in _iter_vevent_blocks(text):
+        try:
+            component = IcsComponent.from_ical(block)
+        except Exception:
+            # Skip malformed events rather than rejecting the whole file
             continue
 
         summary = str(component.get("SUMMARY", "Untitled"))
@@ -34,17 +56,23 @@ def parse_ics_bytes(data: bytes) -> List[Event]:
         if not dtstart or not dtend:
             continue
 
-        start_dt = _normalize_to_datetime(dtstart)
-        end_dt = _normalize_to_datetime(dtend)
+        try:
+            start_dt = _normalize_to_datetime(dtstart)
+            end_dt = _normalize_to_datetime(dtend)
+        except Exception:
+            # icalendar defers some property errors until .dt access
+            continue
 
         if not start_dt or not end_dt or end_dt <= start_dt:
             continue
 
-        out.append(Event(
-            id=str(uuid4()),
+        # Values are already normalized above; model_construct skips the
+        # per-event validator dispatch
+        out.append(Event.model_construct(
+            id=new_id(),
             title=summary,
             start=start_dt,
             end=end_dt,
         ))
 
-    return sorted(out, key=lambda x: x.start)
+    return sorted(out, key=attrgetter("start"))
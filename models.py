@@ -1,7 +1,24 @@
 from __future__ import annotations
-from pydantic import BaseModel, Field
+import secrets
+from itertools import count
+import numpy as np
+from pydantic import BaseModel, Field, PrivateAttr
 from datetime import date, datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
+
+
+# Shared by every AppState so bumped event versions never collide, even
+# across sessions that happen to hold lists of the same length
+_EVENTS_VERSION_COUNTER = count(1)
+
+
+def new_id() -> str:
+    """
+    Mint an id for locally scoped records. 16 hex chars are plenty for a
+    single-user data set, mint faster than a UUID, and halve the id bytes
+    in every saved task/event.
+    """
+    return secrets.token_hex(8)
 
 
 class Subject(BaseModel):
@@ -42,7 +59,101 @@ class Settings(BaseModel):
 class AppState(BaseModel):
     subjects: List[Subject] = Field(default_factory=list)
     tasks: List[Task] = Field(default_factory=list)
-    events: List[Event] = Field(default_factory=list)
+    events: List[Event] = Field(default_factory=list)  # kept sorted by start
     settings: Settings = Field(default_factory=Settings)
     last_generated_on: Optional[date] = None
     profile: str = "default"
+    version: int = 0
+
+    _task_cols: Optional[Dict[str, np.ndarray]] = PrivateAttr(default=None)
+    _task_cols_len: int = PrivateAttr(default=-1)
+    _tasks_by_subject: Optional[Dict[str, List[int]]] = PrivateAttr(default=None)
+    _tasks_by_subject_len: int = PrivateAttr(default=-1)
+    _tasks_by_day: Optional[Dict[date, List[Task]]] = PrivateAttr(default=None)
+    _tasks_by_day_len: int = PrivateAttr(default=-1)
+    _events_version: int = PrivateAttr(default=0)
+
+    def events_version(self) -> int:
+        """
+        Monotonic key for caches derived from events. Values come from a
+        process-wide counter, so they are unique across states and never
+        repeat — unlike id(), which CPython reuses after a list is freed.
+        """
+        if self._events_version == 0:
+            self._events_version = next(_EVENTS_VERSION_COUNTER)
+        return self._events_version
+
+    def bump_events_version(self) -> None:
+        """Call after any event mutation so derived caches rebuild."""
+        self._events_version = next(_EVENTS_VERSION_COUNTER)
+
+    def invalidate_task_columns(self) -> None:
+        """
+        Drop the cached columnar view and subject index. Call after
+        mutating tasks in place (toggling done, editing minutes/notes)
+        so the next aggregation rebuilds fresh arrays.
+        """
+        self._task_cols = None
+        self._task_cols_len = -1
+        self._tasks_by_subject = None
+        self._tasks_by_subject_len = -1
+        self._tasks_by_day = None
+        self._tasks_by_day_len = -1
+
+    def tasks_by_day(self) -> Dict[date, List[Task]]:
+        """
+        Lazy index of day -> tasks scheduled on it, so the Plan tab's
+        today/week lookups are dict hits instead of full-list filters.
+        Rescheduling changes task days in place, so callers that move
+        tasks must invalidate_task_columns() like any other in-place edit.
+        """
+        if (
+            self._tasks_by_day is not None
+            and self._tasks_by_day_len == len(self.tasks)
+        ):
+            return self._tasks_by_day
+        by_day: Dict[date, List[Task]] = {}
+        for t in self.tasks:
+            by_day.setdefault(t.day, []).append(t)
+        self._tasks_by_day = by_day
+        self._tasks_by_day_len = len(self.tasks)
+        return by_day
+
+    def tasks_by_subject(self) -> Dict[str, List[int]]:
+        """
+        Lazy index of subject_id -> task positions, so operations scoped
+        to one subject (renames, per-subject edits) touch only its tasks
+        instead of scanning the whole list.
+        """
+        if (
+            self._tasks_by_subject is not None
+            and self._tasks_by_subject_len == len(self.tasks)
+        ):
+            return self._tasks_by_subject
+        index: Dict[str, List[int]] = {}
+        for i, t in enumerate(self.tasks):
+            index.setdefault(t.subject_id, []).append(i)
+        self._tasks_by_subject = index
+        self._tasks_by_subject_len = len(self.tasks)
+        return index
+
+    def task_columns(self) -> Dict[str, np.ndarray]:
+        """
+        Columnar (structure-of-arrays) view of tasks for vectorized
+        aggregation: minutes/done sums and day/subject masks run in NumPy
+        instead of per-task attribute access. Rebuilt lazily; adding or
+        removing tasks is detected by length, in-place edits need an
+        explicit invalidate_task_columns().
+        """
+        if self._task_cols is not None and self._task_cols_len == len(self.tasks):
+            return self._task_cols
+        cols: Dict[str, np.ndarray] = {
+            "subject_id": np.array([t.subject_id for t in self.tasks], dtype=object),
+            "subject_name": np.array([t.subject_name for t in self.tasks], dtype=object),
+            "day": np.array([t.day for t in self.tasks], dtype="datetime64[D]"),
+            "minutes": np.array([t.minutes for t in self.tasks], dtype=np.int32),
+            "done": np.array([t.done for t in self.tasks], dtype=bool),
+        }
+        self._task_cols = cols
+        self._task_cols_len = len(self.tasks)
+        return cols
@@ -1,30 +1,100 @@
 from __future__ import annotations
+import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date, timedelta
+from functools import lru_cache
+from itertools import groupby
+from operator import attrgetter
 from io import BytesIO
-from typing import List
+from typing import IO, List
+from reportlab import rl_config
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import getSampleStyleSheet
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
 from models import Task, Settings
 
+# Shape checking validates every attribute set on drawables — useful when
+# authoring new layouts, pure overhead for this fixed report
+rl_config.shapeChecking = 0
 
-def week_plan_to_pdf(
+
+@lru_cache(maxsize=1)
+def _get_styles():
+    # getSampleStyleSheet builds the full font/paragraph catalogue; one
+    # copy serves every export
+    return getSampleStyleSheet()
+
+
+# TableStyle walks its command list on construction; both styles are
+# identical across exports, so build them once
+_RISK_TABLE_STYLE = TableStyle([
+    ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
+    ("GRID", (0, 0), (-1, -1), 0.25, colors.grey),
+    ("ALIGN", (2, 1), (3, -1), "RIGHT"),
+])
+
+_DAY_TABLE_STYLE = TableStyle([
+    ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
+    ("GRID", (0, 0), (-1, -1), 0.25, colors.grey),
+    ("BACKGROUND", (0, -1), (-1, -1), colors.whitesmoke),
+    ("ALIGN", (1, 1), (2, -1), "RIGHT"),
+])
+
+# Continuation chunks have no totals row to highlight
+_DAY_TABLE_STYLE_PLAIN = TableStyle([
+    ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
+    ("GRID", (0, 0), (-1, -1), 0.25, colors.grey),
+    ("ALIGN", (1, 1), (2, -1), "RIGHT"),
+])
+
+# ReportLab table layout degrades super-linearly with row count; keeping
+# each Table under this many rows keeps total build time linear
+_TABLE_CHUNK_ROWS = 500
+
+
+def _append_chunked_table(
+    elems: list,
+    header: List[str],
+    rows: List[List[str]],
+    total_row: List[str],
+    col_widths: List[int],
+) -> None:
+    """
+    Emit one Table per chunk of rows, repeating the header on each chunk
+    and closing only the last one with the totals row.
+    """
+    for offset in range(0, max(len(rows), 1), _TABLE_CHUNK_ROWS):
+        chunk = rows[offset:offset + _TABLE_CHUNK_ROWS]
+        last = offset + _TABLE_CHUNK_ROWS >= len(rows)
+        data = [header] + chunk + ([total_row] if last else [])
+        table = Table(data, hAlign="LEFT", colWidths=col_widths)
+        table.setStyle(_DAY_TABLE_STYLE if last else _DAY_TABLE_STYLE_PLAIN)
+        elems.append(table)
+        elems.append(Spacer(1, 8))
+
+
+def week_plan_to_pdf_to(
+    file_obj: IO[bytes],
     tasks: List[Task],
     settings: Settings,
     week_start: date,
     risk_items: List[dict],
-) -> bytes:
-    buf = BytesIO()
+) -> None:
+    """
+    Render the week report directly into a writable binary stream.
+    SimpleDocTemplate writes pages as it builds them, so handing it a
+    file or socket avoids holding the whole document in memory.
+    """
     doc = SimpleDocTemplate(
-        buf,
+        file_obj,
         pagesize=letter,
         leftMargin=40,
         rightMargin=40,
         topMargin=40,
         bottomMargin=40,
     )
-    styles = getSampleStyleSheet()
+    styles = _get_styles()
     elems = []
 
     week_end = week_start + timedelta(days=6)
@@ -54,43 +124,65 @@ def week_plan_to_pdf(
                 r["level"],
             ])
         risk_table = Table(risk_table_data, hAlign="LEFT")
-        risk_table.setStyle(TableStyle([
-            ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
-            ("GRID", (0, 0), (-1, -1), 0.25, colors.grey),
-            ("ALIGN", (2, 1), (3, -1), "RIGHT"),
-        ]))
+        risk_table.setStyle(_RISK_TABLE_STYLE)
         elems.append(risk_table)
         elems.append(Spacer(1, 12))
 
-    # Tasks by day
-    by_day: dict[date, List[Task]] = {}
-    for t in tasks:
-        by_day.setdefault(t.day, []).append(t)
-
-    for day in sorted(by_day.keys()):
+    # One global (day, subject) sort, then contiguous day groups — no
+    # bucket dict and no per-day re-sort
+    ordered = sorted(tasks, key=lambda x: (x.day, x.subject_name.lower()))
+    for day, day_tasks in groupby(ordered, key=attrgetter("day")):
         elems.append(Paragraph(day.strftime("%A, %Y-%m-%d"), styles["Heading3"]))
-        day_tasks = sorted(by_day[day], key=lambda x: x.subject_name.lower())
-        table_data = [["Subject", "Minutes", "Done", "Notes"]]
+        rows = []
         total = 0
         for task in day_tasks:
             total += task.minutes
-            table_data.append([
+            rows.append([
                 task.subject_name,
                 str(task.minutes),
                 "Yes" if task.done else "No",
                 task.notes or "",
             ])
-        table_data.append(["Total", str(total), "", ""])
-
-        table = Table(table_data, hAlign="LEFT", colWidths=[150, 60, 50, 200])
-        table.setStyle(TableStyle([
-            ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
-            ("GRID", (0, 0), (-1, -1), 0.25, colors.grey),
-            ("BACKGROUND", (0, -1), (-1, -1), colors.whitesmoke),
-            ("ALIGN", (1, 1), (2, -1), "RIGHT"),
-        ]))
-        elems.append(table)
-        elems.append(Spacer(1, 8))
+
+        _append_chunked_table(
+            elems,
+            ["Subject", "Minutes", "Done", "Notes"],
+            rows,
+            ["Total", str(total), "", ""],
+            [150, 60, 50, 200],
+        )
 
     doc.build(elems)
+
+
+def week_plan_to_pdf(
+    tasks: List[Task],
+    settings: Settings,
+    week_start: date,
+    risk_items: List[dict],
+) -> bytes:
+    buf = BytesIO()
+    week_plan_to_pdf_to(buf, tasks, settings, week_start, risk_items)
     return buf.getvalue()
+
+
+def _render_spec(spec: tuple) -> bytes:
+    # Module-level so ProcessPoolExecutor can pickle it
+    return week_plan_to_pdf(*spec)
+
+
+def week_plans_to_pdfs_batch(
+    specs: List[tuple],
+) -> List[bytes]:
+    """
+    Render several week reports at once. Each spec is the argument tuple
+    of week_plan_to_pdf: (tasks, settings, week_start, risk_items).
+
+    doc.build is compute-bound Python, so batches fan out across a
+    process pool and scale with cores; results come back in spec order.
+    A batch of one skips the pool entirely.
+    """
+    if len(specs) <= 1:
+        return [week_plan_to_pdf(*spec) for spec in specs]
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+        return list(pool.map(_render_spec, specs))
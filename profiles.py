@@ -1,7 +1,15 @@
 from __future__ import annotations
+import atexit
+import os
+import queue
 import re
+import sys
+import threading
+import time
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, List
 from models import AppState
 from storage import data_path, ensure_data_dir, load_json, save_json
 
@@ -9,18 +17,56 @@ DATA_DIR = data_path("")
 PROFILES_FILE = data_path("profiles.json")
 LEGACY_FILE = data_path("state.json")
 
+_profiles_cache: tuple[tuple[int, int], List[str]] | None = None
+_known_profiles: set[str] = set()
+# Last version this process put on (or read from) disk, per profile.
+# Saves consult this instead of re-parsing the whole state file.
+_disk_versions: Dict[str, int] = {}
 
+_save_queue: "queue.Queue[tuple[str, Any]]" = queue.Queue()
+_save_worker: threading.Thread | None = None
+_save_worker_lock = threading.Lock()
+_last_enqueued: Dict[str, Any] = {}
+
+
+class ProfileConflictError(ValueError):
+    """Raised when a save would clobber a newer on-disk profile version."""
+
+
+def _on_disk_version(profile_name: str) -> int:
+    raw = load_json(_profile_path(profile_name))
+    if isinstance(raw, dict):
+        try:
+            return int(raw.get("version", 0))
+        except (TypeError, ValueError):
+            return 0
+    return 0
+
+
+_UNSAFE_CHARS = re.compile(r"[^A-Za-z0-9_-]+")
+
+
+@lru_cache(maxsize=256)
 def _sanitize_profile_name(name: str) -> str:
-    safe = re.sub(r"[^A-Za-z0-9_-]+", "_", name.strip())
+    safe = _UNSAFE_CHARS.sub("_", name.strip())
     safe = safe.strip("_") or "default"
     return safe[:80]
 
 
+@lru_cache(maxsize=256)
 def _profile_path(profile_name: str) -> Path:
+    # Pure name -> Path mapping, hit on every load and autosave
     safe = _sanitize_profile_name(profile_name)
     return data_path(f"state__{safe}.json")
 
 
+def profile_path(profile_name: str) -> Path:
+    """
+    Public accessor for the on-disk path of a profile's state file.
+    """
+    return _profile_path(profile_name)
+
+
 def _save_profiles_list(profiles: List[str]) -> None:
     save_json(PROFILES_FILE, {"profiles": profiles})
 
@@ -37,12 +83,11 @@ def migrate_legacy_state() -> None:
     if any(DATA_DIR.glob("state__*.json")):
         return
 
-    default_state = AppState(profile="default")
     raw = load_json(LEGACY_FILE)
     try:
         migrated_state = AppState.model_validate(raw)
     except Exception:
-        migrated_state = default_state
+        migrated_state = AppState(profile="default")
 
     migrated_state.profile = "default"
     save_profile("default", migrated_state)
@@ -52,18 +97,45 @@ def migrate_legacy_state() -> None:
         pass
 
 
+def _profiles_stamp() -> tuple[int, int]:
+    # profiles.json changes when the list is rewritten; the directory
+    # mtime changes when profile files are created or removed
+    def mtime_ns(path) -> int:
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return 0
+
+    return (mtime_ns(PROFILES_FILE), mtime_ns(DATA_DIR))
+
+
 def list_profiles() -> List[str]:
+    global _profiles_cache
     ensure_data_dir()
+    stamp = _profiles_stamp()
+    if _profiles_cache is not None and _profiles_cache[0] == stamp:
+        # Copy so callers that append to the result don't poison the cache
+        return list(_profiles_cache[1])
     data = load_json(PROFILES_FILE)
     profiles: List[str] = [p for p in data.get("profiles", []) if isinstance(p, str)] if isinstance(data, dict) else []
     needs_save = not isinstance(data, dict) or "profiles" not in data
 
-    # Discover any files on disk not in the list
+    # Discover any files on disk not in the list. scandir streams the
+    # directory entries with their type info in one pass, instead of the
+    # per-path stat round trips glob incurs.
     discovered = []
-    if DATA_DIR.exists():
-        for path in DATA_DIR.glob("state__*.json"):
-            suffix = path.stem.replace("state__", "", 1)
-            discovered.append(suffix.replace("_", " ").strip() or "default")
+    try:
+        with os.scandir(DATA_DIR) as entries:
+            for entry in entries:
+                name = entry.name
+                if not (name.startswith("state__") and name.endswith(".json")):
+                    continue
+                if not entry.is_file():
+                    continue
+                suffix = name[len("state__"):-len(".json")]
+                discovered.append(suffix.replace("_", " ").strip() or "default")
+    except FileNotFoundError:
+        pass
 
     combined = []
     for name in profiles + discovered:
@@ -83,37 +155,169 @@ def list_profiles() -> List[str]:
     default_path = _profile_path("default")
     if "default" in combined and not default_path.exists():
         default_state = AppState(profile="default")
-        save_json(default_path, default_state.model_dump(mode="json"))
+        save_json(default_path, default_state.model_dump())
 
+    # Stamp taken after any writes above so the cache survives them
+    _profiles_cache = (_profiles_stamp(), list(combined))
+    _known_profiles.update(combined)
     return combined
 
 
 def load_profile(profile_name: str) -> AppState:
     ensure_data_dir()
-    default_state = AppState(profile=profile_name)
     raw = load_json(_profile_path(profile_name))
     try:
         state = AppState.model_validate(raw)
     except Exception:
-        state = default_state
+        # Only build the default when the stored state is unusable.
+        # Seed it with the on-disk version so the reset passes the
+        # conflict check instead of wedging on its own corrupt file.
+        state = AppState(profile=profile_name)
+        state.version = _on_disk_version(profile_name)
         save_profile(profile_name, state)
     state.profile = profile_name
+    _disk_versions[profile_name] = state.version
+    # Establish the sorted-events invariant the renderers rely on
+    state.events.sort(key=attrgetter("start"))
+    # Intern the heavily repeated names so task chunks share one string
+    for t in state.tasks:
+        t.subject_name = sys.intern(t.subject_name)
 
-    profiles = list_profiles()
-    if profile_name not in profiles:
-        profiles.append(profile_name)
-        _save_profiles_list(profiles)
+    # Membership goes through the session cache; profiles already seen
+    # skip the list read and rewrite that used to run on every load
+    _register_profile(profile_name)
 
     return state
 
 
-def save_profile(profile_name: str, state: AppState) -> None:
-    state.profile = profile_name
-    save_json(_profile_path(profile_name), state.model_dump(mode="json"))
+def _register_profile(profile_name: str) -> None:
+    # Autosaves hit this on every write; profiles already seen this
+    # session skip the list read and rewrite entirely
+    if profile_name in _known_profiles:
+        return
     profiles = list_profiles()
     if profile_name not in profiles:
         profiles.append(profile_name)
         _save_profiles_list(profiles)
+    _known_profiles.add(profile_name)
+
+
+def save_profile(profile_name: str, state: AppState) -> None:
+    state.profile = profile_name
+    disk_version = _on_disk_version(profile_name)
+    if disk_version > state.version:
+        raise ProfileConflictError(
+            "Profile changed elsewhere — reload before saving."
+        )
+    state.version = disk_version + 1
+    save_json(_profile_path(profile_name), state.model_dump())
+    _disk_versions[profile_name] = state.version
+    _register_profile(profile_name)
+
+
+# How long the writer lingers after the first queued snapshot so a burst
+# of rapid edits collapses into a single atomic write per profile
+_SAVE_COALESCE_DELAY = 0.25
+
+
+def _save_worker_loop() -> None:
+    while True:
+        name, payload = _save_queue.get()
+        time.sleep(_SAVE_COALESCE_DELAY)
+        pending: Dict[str, Any] = {name: payload}
+        drained = 0
+        # Coalesce bursts: only the newest snapshot per profile gets written
+        while True:
+            try:
+                extra_name, extra_payload = _save_queue.get_nowait()
+            except queue.Empty:
+                break
+            pending[extra_name] = extra_payload
+            drained += 1
+        for pending_name, pending_payload in pending.items():
+            try:
+                save_json(_profile_path(pending_name), pending_payload)
+            except Exception:
+                # A failed background write must not kill the worker.
+                # Drop the enqueue-time bookkeeping so the next save is
+                # neither deduped against a snapshot that never landed
+                # nor versioned against one
+                _last_enqueued.pop(pending_name, None)
+                _disk_versions.pop(pending_name, None)
+        for _ in range(drained + 1):
+            _save_queue.task_done()
+
+
+def _ensure_save_worker() -> None:
+    global _save_worker
+    with _save_worker_lock:
+        if _save_worker is None or not _save_worker.is_alive():
+            _save_worker = threading.Thread(
+                target=_save_worker_loop, name="profile-saver", daemon=True
+            )
+            _save_worker.start()
+
+
+def flush_saves() -> None:
+    """
+    Block until every queued profile snapshot has been written to disk.
+    """
+    if _save_worker is not None and _save_worker.is_alive():
+        _save_queue.join()
+
+
+atexit.register(flush_saves)
+
+
+def _snapshot_state(state: AppState) -> Any:
+    """
+    Produce the write buffer for a save: a fully detached plain-dict copy
+    of the live state. The UI thread keeps mutating the live AppState
+    while the writer encodes this snapshot, so neither side ever needs a
+    lock on the model (double-buffered saves). Dates stay native here;
+    orjson in the storage layer encodes them without an isoformat pass.
+    """
+    return state.model_dump()
+
+
+def _same_content(a: Any, b: Any) -> bool:
+    """Compare two snapshots ignoring the version counter."""
+    if not (isinstance(a, dict) and isinstance(b, dict)):
+        return False
+    strip = lambda d: {k: v for k, v in d.items() if k != "version"}
+    return strip(a) == strip(b)
+
+
+def has_pending_saves() -> bool:
+    """True while queued snapshots are still waiting to hit disk."""
+    return not _save_queue.empty()
+
+
+def schedule_save(profile_name: str, state: AppState) -> None:
+    """
+    Queue an asynchronous profile save. The snapshot taken here is the
+    only thing the writer thread ever sees; the live state is never
+    shared across threads. Saves whose content matches the last enqueued
+    snapshot are dropped instead of rewriting identical JSON.
+    """
+    state.profile = profile_name
+    payload = _snapshot_state(state)
+    if _same_content(_last_enqueued.get(profile_name), payload):
+        return
+    disk_version = _disk_versions.get(profile_name)
+    if disk_version is None:
+        disk_version = _on_disk_version(profile_name)
+    if disk_version > state.version:
+        raise ProfileConflictError(
+            "Profile changed elsewhere — reload before saving."
+        )
+    state.version = max(state.version, disk_version) + 1
+    payload["version"] = state.version
+    _disk_versions[profile_name] = state.version
+    _ensure_save_worker()
+    _save_queue.put((profile_name, payload))
+    _last_enqueued[profile_name] = payload
+    _register_profile(profile_name)
 
 
 def create_profile(profile_name: str) -> AppState:
@@ -137,14 +341,24 @@ def create_profile(profile_name: str) -> AppState:
 
 
 def delete_profile(profile_name: str) -> None:
+    global _profiles_cache
+    # A queued write landing after the unlink would resurrect the file
+    flush_saves()
+    _last_enqueued.pop(profile_name, None)
+    _known_profiles.discard(profile_name)
+    _disk_versions.pop(profile_name, None)
     path = _profile_path(profile_name)
     try:
         path.unlink()
     except FileNotFoundError:
         pass
 
-    profiles = [p for p in list_profiles() if p != profile_name]
+    before = list_profiles()
+    profiles = [p for p in before if p != profile_name]
     if not profiles:
         profiles = ["default"]
         save_profile("default", AppState(profile="default"))
-    _save_profiles_list(profiles)
+    # Only rewrite the list when the delete actually changed it
+    if profiles != before:
+        _save_profiles_list(profiles)
+        _profiles_cache = (_profiles_stamp(), list(profiles))
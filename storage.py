@@ -1,9 +1,15 @@
 from __future__ import annotations
 import json
+import os
 import shutil
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
 
 DATA_DIR = Path(__file__).resolve().parent / ".data"
 
@@ -21,10 +27,10 @@ def data_path(filename: str | Path) -> Path:
     return DATA_DIR / Path(filename)
 
 
-def _backup_file(path: Path, content: str) -> None:
+def _backup_file(path: Path, content: bytes) -> None:
     try:
         backup = path.with_suffix(path.suffix + ".bak")
-        backup.write_text(content, encoding="utf-8")
+        backup.write_bytes(content)
     except Exception:
         # If backup fails we still continue with a reset
         pass
@@ -56,6 +62,16 @@ def migrate_repo_data_once() -> None:
         dest = target_dir / src.name
         if dest.exists():
             continue
+        # Both directories normally sit on the same filesystem, so a
+        # rename moves the file in one atomic step with no data copy and
+        # leaves nothing behind to mark as .migrated
+        try:
+            os.replace(src, dest)
+            continue
+        except OSError:
+            pass
+        # Rename refused (cross-device link, mount restrictions, ...):
+        # fall back to copy, then park the source
         try:
             shutil.copy2(src, dest)
         except Exception:
@@ -82,20 +98,22 @@ def load_json(path: Path | str) -> Any:
         return {}
 
     try:
-        raw_text = path.read_text(encoding="utf-8")
+        raw = path.read_bytes()
     except Exception:
         return {}
 
-    text = raw_text.strip()
-    if not text:
-        _backup_file(path, raw_text)
+    if not raw or raw.isspace():
+        _backup_file(path, raw)
         save_json(path, {})
         return {}
 
     try:
-        return json.loads(text)
+        # Both decoders take bytes, so the utf-8 decode pass is skipped
+        if orjson is not None:
+            return orjson.loads(raw)
+        return json.loads(raw)
     except Exception:
-        _backup_file(path, raw_text)
+        _backup_file(path, raw)
         save_json(path, {})
         return {}
 
@@ -108,8 +126,13 @@ def save_json(path: Path | str, payload: Any) -> None:
     ensure_data_dir()
     path.parent.mkdir(parents=True, exist_ok=True)
     temp = path.with_suffix(path.suffix + ".tmp")
-    temp.write_text(
-        json.dumps(payload, ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
+    if orjson is not None:
+        # orjson encodes dates/datetimes natively, so callers can hand us
+        # plain model_dump() output without a Python-side isoformat pass
+        temp.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    else:
+        temp.write_text(
+            json.dumps(payload, ensure_ascii=False, indent=2, default=str),
+            encoding="utf-8",
+        )
     temp.replace(path)